@@ -12,13 +12,22 @@ from azure.ai.documentintelligence.aio import (
 from azure.ai.documentintelligence.models import AnalyzeResult
 from azure.core.credentials import AzureKeyCredential
 from fastapi import APIRouter, File, Form, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+import orjson
 from pypdf import PdfReader
 from utils import ensure_env_loaded
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared immutable default for dict.get() on optional element arrays, so lookups of
+# missing keys don't allocate a new empty list each time
+_EMPTY: Tuple[Any, ...] = ()
+
+# Element arrays of an Azure DI result that are merged (with shifted spans and page
+# numbers) when batches are stitched together
+_STITCHED_ELEMENT_KEYS: Tuple[str, ...] = ("pages", "paragraphs", "tables", "words", "lines", "selectionMarks")
+
 
 def generate_element_id(element_type: str, page_number: int, index: int, content: str = "") -> str:
     """
@@ -231,18 +240,59 @@ def validate_batch_sequence(batches: List[Dict[str, Any]]) -> None:
     if len(batches) < 2:
         return
     
-    for i in range(1, len(batches)):
-        prev_batch = batches[i-1]
-        curr_batch = batches[i]
-        
-        if not prev_batch.get("pages") or not curr_batch.get("pages"):
+    # Single pass: each batch's page numbers are collected once and reduced in C,
+    # rather than scanning every batch twice (once as "previous", once as "current")
+    prev_max = None
+    for batch in batches:
+        pages = batch.get("pages")
+        if not pages:
+            # Batches without pages are skipped, along with the comparison across them
+            prev_max = None
             continue
-            
-        prev_max = max(page["pageNumber"] for page in prev_batch["pages"])
-        curr_min = min(page["pageNumber"] for page in curr_batch["pages"])
         
-        if curr_min != prev_max + 1:
+        page_numbers = [page["pageNumber"] for page in pages]
+        curr_min = min(page_numbers)
+        
+        if prev_max is not None and curr_min != prev_max + 1:
             raise ValueError(f"Non-consecutive batches: gap between page {prev_max} and {curr_min}")
+        
+        prev_max = max(page_numbers)
+
+
+def _shift_element(element: Dict[str, Any], content_offset: int, page_offset: int) -> Dict[str, Any]:
+    """
+    Return a copy of an Azure DI element with its spans and page numbers shifted.
+    
+    Only the parts that change (spans, span, pageNumber, boundingRegions) are copied;
+    all other fields, and the spans or page fields when their offset is 0, are shared
+    with the original element, which is left untouched.
+    
+    Args:
+        element: Element from an Azure DI result (page, paragraph, table, word, etc.)
+        content_offset: Offset to add to every span offset
+        page_offset: Offset to add to every page number
+        
+    Returns:
+        Dict[str, Any]: The shifted copy of the element
+    """
+    shifted = dict(element)
+    # Handle both "spans" (for paragraphs, lines, etc.) and "span" (for words)
+    if content_offset:
+        if "spans" in element:
+            shifted["spans"] = [
+                {**span, "offset": span["offset"] + content_offset} for span in element["spans"]
+            ]
+        elif "span" in element:
+            shifted["span"] = {**element["span"], "offset": element["span"]["offset"] + content_offset}
+    if page_offset:
+        if "pageNumber" in element:
+            shifted["pageNumber"] = element["pageNumber"] + page_offset
+        if "boundingRegions" in element:
+            shifted["boundingRegions"] = [
+                {**region, "pageNumber": region["pageNumber"] + page_offset}
+                for region in element["boundingRegions"]
+            ]
+    return shifted
 
 
 def stitch_analysis_results(
@@ -254,65 +304,209 @@ def stitch_analysis_results(
     """
     Stitches a new analysis result dictionary into an existing one.
     
+    A thin wrapper around Stitcher for stitching a single pair; use a Stitcher (or
+    stitch_analysis_results_many) to stitch a longer sequence of batches.
+    
     Args:
-        stitched_result: The existing stitched result (will be modified in place)
-        new_result: The new batch to stitch in
+        stitched_result: The existing stitched result (will be modified in place; it is
+            never copied, so pass a copy if the caller still needs the original)
+        new_result: The new batch to stitch in (left unmodified; shifted copies of its
+            elements are added to the stitched result)
         page_offset: Page offset to apply (calculated automatically if None)
         validate_inputs: Whether to validate input structure
         
     Returns:
-        Dict[str, Any]: The stitched result (same object as stitched_result)
+        Dict[str, Any]: The stitched result (same object as stitched_result, or a new
+        dictionary when stitched_result is empty)
         
     Raises:
         ValueError: If input validation fails
     """
     # Validate inputs if requested
-    if validate_inputs:
-        if stitched_result:  # Don't validate empty first batch
-            validate_batch_structure(stitched_result)
-        validate_batch_structure(new_result)
+    if validate_inputs and stitched_result:  # Don't validate empty first batch
+        validate_batch_structure(stitched_result)
     
-    # Calculate page offset automatically if not provided
-    if page_offset is None:
-        page_offset = calculate_page_offset(stitched_result, new_result)
+    stitcher = Stitcher.from_result(stitched_result, validate_inputs=validate_inputs)
+    return stitcher.add_batch(new_result, page_offset=page_offset).finalize()
+
+
+def _append_shifted_elements(
+    stitched_result: Dict[str, Any],
+    new_result: Dict[str, Any],
+    content_offset: int,
+    page_offset: int
+) -> None:
+    """
+    Append shifted copies of the new batch's elements to the stitched result.
     
-    # Handle first batch case
-    if not stitched_result:
-        # For the first batch, we just need to update page numbers if offset is needed
-        if page_offset != 0:
-            for page in new_result.get("pages", []):
-                page["pageNumber"] += page_offset
-            for element in new_result.get("paragraphs", []) + new_result.get("tables", []):
-                for region in element.get("boundingRegions", []):
-                    region["pageNumber"] += page_offset
-        return new_result
-
-    content_offset = len(stitched_result["content"])
-    concatenated_content = stitched_result["content"] + new_result["content"]
-
-    # Update spans and page numbers in all relevant elements
-    for element_list_key in ["pages", "paragraphs", "tables", "words", "lines", "selectionMarks"]:
-        for element in new_result.get(element_list_key, []):
-            # Handle both "spans" (for paragraphs, lines, etc.) and "span" (for words)
-            if "spans" in element:
-                for span in element["spans"]:
-                    span["offset"] += content_offset
-            elif "span" in element:
-                element["span"]["offset"] += content_offset
-            if "pageNumber" in element:
-                element["pageNumber"] += page_offset
-            if "boundingRegions" in element:
-                for region in element["boundingRegions"]:
-                    region["pageNumber"] += page_offset
-
-    # Append the updated elements to the stitched result
-    for key in ["pages", "paragraphs", "tables", "words", "lines", "selectionMarks"]:
-        if key not in stitched_result:
-            stitched_result[key] = []
-        stitched_result[key].extend(new_result.get(key, []))
-
-    stitched_result["content"] = concatenated_content
-    return stitched_result
+    Extending with a list (rather than a generator) lets each target list grow to
+    its final size in one step.
+    """
+    for key in _STITCHED_ELEMENT_KEYS:
+        stitched_result.setdefault(key, []).extend([
+            _shift_element(element, content_offset, page_offset)
+            for element in new_result.get(key, _EMPTY)
+        ])
+
+
+class Stitcher:
+    """
+    Incrementally stitches analysis result batches into a single result.
+    
+    Each add_batch() call appends shifted copies of the batch's elements to accumulator
+    lists and records its content; finalize() joins the contents once. Stitching N batches
+    is therefore linear in the size of the document, rather than re-concatenating the
+    growing content and re-scanning the stitched pages for every batch. Batches passed to
+    add_batch() are left unmodified.
+    """
+    
+    def __init__(self, validate_inputs: bool = True):
+        """
+        Args:
+            validate_inputs: Whether to validate the structure of each batch
+        """
+        self.validate_inputs = validate_inputs
+        self._result: Dict[str, Any] = {}
+        self._content_parts: List[str] = []
+        self._content_length = 0
+        # Highest stitched page number (None when nothing with pages has been stitched).
+        # When continuing an existing result it is only computed once first needed.
+        self._max_page: Optional[int] = None
+        self._max_page_known = True
+    
+    @classmethod
+    def from_result(cls, stitched_result: Dict[str, Any], validate_inputs: bool = True) -> "Stitcher":
+        """
+        Create a stitcher that continues an existing stitched result.
+        
+        The stitcher takes ownership of stitched_result: its element lists are extended
+        in place and its content is replaced on finalize(). An empty stitched_result is
+        treated as a fresh start, and a new result dictionary is built instead.
+        
+        Args:
+            stitched_result: The existing stitched result (not validated here)
+            validate_inputs: Whether to validate the structure of each added batch
+            
+        Returns:
+            Stitcher: A stitcher positioned after the last page of stitched_result
+        """
+        stitcher = cls(validate_inputs=validate_inputs)
+        if stitched_result:
+            stitcher._result = stitched_result
+            content = stitched_result.get("content", "")
+            stitcher._content_parts.append(content)
+            stitcher._content_length = len(content)
+            # Only scanned if a page offset has to be calculated
+            stitcher._max_page_known = False
+        return stitcher
+    
+    @property
+    def page_count(self) -> int:
+        """Number of pages stitched so far."""
+        return len(self._result.get("pages", _EMPTY))
+    
+    def _current_max_page(self) -> Optional[int]:
+        """Highest stitched page number, or None if no pages have been stitched."""
+        if not self._max_page_known:
+            pages = self._result.get("pages")
+            self._max_page = max(page["pageNumber"] for page in pages) if pages else None
+            self._max_page_known = True
+        return self._max_page
+    
+    def add_batch(self, batch: Dict[str, Any], page_offset: Optional[int] = None) -> "Stitcher":
+        """
+        Stitch the next batch onto the end of the document.
+        
+        With validate_inputs disabled, a batch may lack "pages" or "content"; it is then
+        stitched as if those were empty.
+        
+        Args:
+            batch: The next batch in page order
+            page_offset: Page offset to apply (calculated automatically if None, in the
+                same way as calculate_page_offset; 0 for a batch without pages)
+            
+        Returns:
+            Stitcher: This stitcher, so calls can be chained
+            
+        Raises:
+            ValueError: If input validation fails
+        """
+        if self.validate_inputs:
+            validate_batch_structure(batch)
+        pages = batch.get("pages")
+        content = batch.get("content", "")
+        
+        # Same rule as calculate_page_offset, using the running maximum page number
+        # instead of scanning every stitched page again
+        if page_offset is None:
+            max_page = self._current_max_page() if pages else None
+            if max_page is None:
+                page_offset = 0
+            else:
+                page_offset = max_page - min(page["pageNumber"] for page in pages) + 1
+        
+        if not self._result:
+            # For the first batch we only need to update page numbers. The element lists
+            # are copied so that later batches never extend the caller's lists.
+            first_result = dict(batch)
+            for key in _STITCHED_ELEMENT_KEYS:
+                if key in batch:
+                    first_result[key] = [
+                        _shift_element(element, 0, page_offset) for element in batch[key]
+                    ]
+            self._result = first_result
+        else:
+            _append_shifted_elements(self._result, batch, self._content_length, page_offset)
+        
+        # Keep the running maximum current (it stays unknown until first needed)
+        if pages and self._max_page_known:
+            batch_max_page = max(page["pageNumber"] for page in pages) + page_offset
+            if self._max_page is None or batch_max_page > self._max_page:
+                self._max_page = batch_max_page
+        
+        self._content_parts.append(content)
+        self._content_length += len(content)
+        return self
+    
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Return the stitched result, with the batch contents joined.
+        
+        More batches may be added afterwards; finalize() then returns the same result
+        dictionary, updated.
+        
+        Returns:
+            Dict[str, Any]: The stitched result (empty if no batches were added)
+        """
+        if self._result:
+            self._result["content"] = "".join(self._content_parts)
+        return self._result
+
+
+def stitch_analysis_results_many(
+    batches: List[Dict[str, Any]],
+    validate_inputs: bool = True
+) -> Dict[str, Any]:
+    """
+    Stitches a sequence of analysis result dictionaries into a single result.
+    
+    Produces the same result as folding the batches through stitch_analysis_results,
+    but in a single pass through a Stitcher.
+    
+    Args:
+        batches: List of batch dictionaries in page order (left unmodified)
+        validate_inputs: Whether to validate the structure of each batch
+        
+    Returns:
+        Dict[str, Any]: The stitched result (empty if no batches were given)
+        
+    Raises:
+        ValueError: If input validation fails
+    """
+    stitcher = Stitcher(validate_inputs=validate_inputs)
+    for batch in batches:
+        stitcher.add_batch(batch)
+    return stitcher.finalize()
 
 
 async def analyze_pdf_in_batches(
@@ -322,7 +516,6 @@ async def analyze_pdf_in_batches(
     Analyzes a PDF in batches and stitches the results together.
     """
     total_pages = get_pdf_page_count(file_path)
-    stitched_result: Dict[str, Any] = {}
     all_results = []
 
     async def analyze_range(page_start, page_end):
@@ -354,14 +547,11 @@ async def analyze_pdf_in_batches(
     # Sort results by page start to ensure correct order for stitching
     all_results.sort(key=lambda x: x[0])
 
-    for page_offset, result_dict in all_results:
-        if not stitched_result:
-            # First result - let stitch_analysis_results handle page numbering
-            stitched_result = stitch_analysis_results({}, result_dict)
-        else:
-            # Subsequent results - automatic offset calculation will handle page numbers
-            stitched_result = stitch_analysis_results(stitched_result, result_dict)
-            
+    # Stitch all batches in one pass; automatic offset calculation handles page numbers
+    stitched_result = stitch_analysis_results_many(
+        [result_dict for _, result_dict in all_results]
+    )
+
     if not stitched_result:
         return {}, ""
 
@@ -439,7 +629,8 @@ async def extract(
                 # Return original without IDs
                 response_content["analysis_result"] = analysis_result
             
-            return JSONResponse(content=response_content)
+            # Serialized with orjson: the stitched result can be many megabytes
+            return Response(orjson.dumps(response_content), media_type="application/json")
             
     except Exception as e:
         logger.error(f"Error during PDF extraction: {e}", exc_info=True)
@@ -0,0 +1,160 @@
+"""
+Shared pytest fixtures.
+
+The Dracula batch fixtures are multi-MB Azure Document Intelligence results. They are
+loaded once per test session; tests must not modify them (see clone_for_stitching in
+test_stitching_logic.py for passing one as the first batch of a stitch).
+"""
+
+import functools
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson  # C parser, noticeably faster on the multi-MB batch files
+import pytest
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "dracula"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(name: str):
+    """Load and parse a Dracula fixture file, at most once per process."""
+    path = FIXTURE_DIR / name
+    # Parse straight from the page cache rather than copying the file into a bytes object.
+    # There is deliberately no on-disk cache of the parsed result: unpickling a parsed
+    # 50-page batch (~56 ms) is slower than orjson parsing the JSON itself (~40 ms).
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _shape(data):
+    """Cheap fingerprint of a loaded fixture: the length of each top-level string and list."""
+    return {key: len(value) for key, value in data.items() if isinstance(value, (str, list))}
+
+
+def _shared_fixture(name: str):
+    """
+    Yield a loaded fixture, then check at session teardown that no test changed it.
+    
+    The parsed dicts are shared rather than frozen (the stitching code validates its input
+    with isinstance(..., dict)), so this catches the usual accident instead: stitching into
+    a shared batch, which extends its lists and replaces its content.
+    """
+    data = _load_fixture(name)
+    shape = _shape(data)
+    yield data
+    assert _shape(data) == shape, f"{name} was modified by a test; pass clone_for_stitching(...) instead"
+
+
+# All batch files, in page order, for full 353-page document reconstruction
+_ALL_BATCH_FILES = (
+    "batch_1-50.json",
+    "batch_51-100.json",
+    "batch_101-150.json",
+    "batch_151-200.json",
+    "batch_201-250.json",
+    "batch_251-300.json",
+    "batch_301-350.json",
+    "batch_351-353.json",
+)
+
+
+# Fixture name -> files it loads, used to preload the files a test run needs
+_FIXTURE_FILES = {
+    "real_batch_1_50": ("batch_1-50.json",),
+    "real_batch_51_100": ("batch_51-100.json",),
+    "real_batch_101_150": ("batch_101-150.json",),
+    "ground_truth_result": ("ground_truth_result.json",),
+    "all_batch_fixtures": _ALL_BATCH_FILES,
+    "ground_truth_full": ("ground_truth_result.json",),
+}
+
+
+# Every fixture backed by the Dracula files
+_DRACULA_FIXTURES = frozenset(_FIXTURE_FILES)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep every test that uses the Dracula fixtures on a single pytest-xdist worker.
+    
+    With ``--dist loadgroup`` only that worker parses the fixture files; the other workers
+    never load them (the preload below is skipped on workers). This must run before
+    xdist's own hook, which reads the marker to assign groups. Without xdist the marker
+    has no effect.
+    """
+    for item in items:
+        if _DRACULA_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.xdist_group("dracula_fixtures"))
+
+
+def pytest_collection_finish(session):
+    """
+    Preload the Dracula fixture files requested by the collected tests.
+    
+    Reading and parsing happen once, up front, instead of stalling whichever test first
+    requests a fixture. Runs that don't collect any of these tests load nothing.
+    
+    Skipped on pytest-xdist workers: every worker collects the whole suite, so preloading
+    there would parse the files on all of them. Workers load the fixtures lazily instead.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    requested = set()
+    for item in session.items:
+        requested.update(getattr(item, "fixturenames", ()))
+    file_names = sorted({
+        file_name
+        for fixture_name, fixture_files in _FIXTURE_FILES.items() if fixture_name in requested
+        for file_name in fixture_files
+    })
+    if not file_names:
+        return
+    # File reads release the GIL, so loading in parallel overlaps the disk I/O
+    with ThreadPoolExecutor(max_workers=min(len(file_names), os.cpu_count() or 1)) as executor:
+        list(executor.map(_load_fixture, file_names))
+
+
+@pytest.fixture(scope="session")
+def real_batch_1_50():
+    """Load the real batch_1-50.json fixture."""
+    yield from _shared_fixture("batch_1-50.json")
+
+
+@pytest.fixture(scope="session")
+def real_batch_51_100():
+    """Load the real batch_51-100.json fixture."""
+    yield from _shared_fixture("batch_51-100.json")
+
+
+@pytest.fixture(scope="session")
+def real_batch_101_150():
+    """Load the real batch_101-150.json fixture."""
+    yield from _shared_fixture("batch_101-150.json")
+
+
+@pytest.fixture(scope="session")
+def ground_truth_result():
+    """Load the ground truth result fixture."""
+    yield from _shared_fixture("ground_truth_result.json")
+
+
+@pytest.fixture(scope="session")
+def all_batch_fixtures():
+    """Load all 8 batch files in the correct order for full document reconstruction."""
+    guards = [_shared_fixture(name) for name in _ALL_BATCH_FILES]
+    yield tuple(next(guard) for guard in guards)
+    # Resume each guard to run its teardown check
+    for guard in guards:
+        next(guard, None)
+
+
+@pytest.fixture(scope="session")
+def ground_truth_full():
+    """Load the ground truth result fixture (the same parsed file as ground_truth_result)."""
+    yield from _shared_fixture("ground_truth_result.json")
@@ -4,8 +4,6 @@ Test custom pattern detection for legal and forensic documents.
 
 import pytest
 from typing import Dict, List
-import sys
-sys.path.append('..')
 from routes.anonymization import AnonymizationConfig, create_anonymizer, anonymize_text_with_date_shift
 from routes.pattern_registry import LEGAL_PATTERNS, MEDICAL_PATTERNS, get_replacement_for_pattern
 
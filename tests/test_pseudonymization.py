@@ -26,8 +26,6 @@ We scheduled a meeting for January 15, 1985 (yes, time travel!).
 
 def test_serialize_deserialize_vault():
     """Test vault serialization and deserialization."""
-    import sys
-    sys.path.append('..')
     from routes.anonymization import serialize_vault, deserialize_vault, Vault
     
     # Create a vault with some test data
@@ -6,33 +6,59 @@ batch results into a single, cohesive analysis result. Tests are organized by co
 
 Phase 1: Small synthetic and real data subsets (CRITICAL)
 Phase 2: Medium-scale real fixture testing (HIGH)  
-Phase 3: Large-scale testing (FUTURE - documented as TODOs)
+Phase 3: Large-scale synthetic stress testing
 
 All tests directly call the stitch_analysis_results function with JSON dictionaries
 to avoid Azure SDK mocking issues and TestClient serialization problems.
 """
 
-import json
-import os
-import sys
-from typing import Any, Dict
+import hashlib
+import re
+from array import array
+from itertools import islice
+from operator import itemgetter, le
+from typing import Any, Dict, List
 
 import pytest
 
-# Add project root to path to import the function under test
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, project_root)
-
 from routes.extraction import (
+    Stitcher,
     calculate_page_offset,
     stitch_analysis_results,
+    stitch_analysis_results_many,
     validate_batch_sequence,
     validate_batch_structure,
 )
 
 
+_get_page_number = itemgetter("pageNumber")
+
+
+def get_page_numbers(result: Dict[str, Any]) -> List[int]:
+    """Return the page numbers of a (stitched) result in page order."""
+    return list(map(_get_page_number, result["pages"]))
+
+
+def get_page_number_array(result: Dict[str, Any]) -> array:
+    """Return the page numbers of a result as a C int array, for whole-document comparisons."""
+    return array("i", map(_get_page_number, result["pages"]))
+
+
+def describe_first_offset_decrease(offsets) -> str:
+    """Describe the first span offset that is smaller than its predecessor (for assertion messages)."""
+    for i in range(1, len(offsets)):
+        if offsets[i] < offsets[i - 1]:
+            return f"Span {i} has offset {offsets[i]} < previous {offsets[i - 1]}"
+    return "Span offsets are non-decreasing"
+
+
 def create_simple_batch(page_numbers: list, content: str) -> Dict[str, Any]:
-    """Create a simple synthetic batch for testing."""
+    """
+    Create a simple synthetic batch for testing.
+    
+    A fresh dict is built on every call: batches passed as the first argument of a
+    stitch are extended in place, and create_batch_with_paragraph adds keys.
+    """
     return {
         "content": content,
         "pages": [{"pageNumber": num} for num in page_numbers]
@@ -41,26 +67,65 @@ def create_simple_batch(page_numbers: list, content: str) -> Dict[str, Any]:
 
 def create_batch_with_paragraph(page_numbers: list, content: str, paragraph_content: str) -> Dict[str, Any]:
     """Create a batch with a paragraph for testing."""
+    batch = create_simple_batch(page_numbers, content)
+    batch["paragraphs"] = [
+        {
+            "content": paragraph_content,
+            "spans": [{"offset": 0, "length": len(paragraph_content)}]
+        }
+    ]
+    return batch
+
+
+def create_batch_with_word(page_numbers: list, content: str, word_content: str) -> Dict[str, Any]:
+    """Create a batch with a single word (words use "span" rather than "spans") for testing."""
+    batch = create_simple_batch(page_numbers, content)
+    batch["words"] = [
+        {
+            "content": word_content,
+            "span": {"offset": 0, "length": len(word_content)}
+        }
+    ]
+    return batch
+
+
+def create_synthetic_batch(first_page: int, page_count: int, paragraph_text: str = "Synthetic paragraph. ") -> Dict[str, Any]:
+    """Create a synthetic batch with one paragraph per page for large-scale testing."""
+    text_len = len(paragraph_text)
+    page_numbers = range(first_page, first_page + page_count)
     return {
-        "content": content,
+        "content": paragraph_text * page_count,
         "pages": [{"pageNumber": num} for num in page_numbers],
         "paragraphs": [
             {
-                "content": paragraph_content,
-                "spans": [{"offset": 0, "length": len(paragraph_content)}]
+                "spans": [{"offset": i * text_len, "length": text_len}],
+                "boundingRegions": [{"pageNumber": num}]
             }
+            for i, num in enumerate(page_numbers)
         ]
     }
 
 
+def clone_for_stitching(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a batch so it can be passed as the first (stitched) argument of a stitch.
+    
+    Stitching extends the first batch's element lists and replaces its content, but never
+    modifies the elements themselves, so copying the top-level lists is enough to keep
+    the session-scoped fixtures intact.
+    """
+    return {key: list(value) if isinstance(value, list) else value for key, value in batch.items()}
+
+
 def extract_page_subset(batch: Dict[str, Any], start_page: int, end_page: int) -> Dict[str, Any]:
     """Extract a subset of pages from a batch for testing."""
+    valid_pages = frozenset(range(start_page, end_page + 1))
     subset = {
         "content": batch["content"],
-        "pages": [p for p in batch["pages"] if start_page <= p["pageNumber"] <= end_page],
+        "pages": [p for p in batch["pages"] if p["pageNumber"] in valid_pages],
         "paragraphs": [
-            p for p in batch.get("paragraphs", [])
-            if any(start_page <= r["pageNumber"] <= end_page for r in p.get("boundingRegions", []))
+            p for p in batch.get("paragraphs", ())
+            if any(r["pageNumber"] in valid_pages for r in p.get("boundingRegions", ()))
         ]
     }
     return subset
@@ -79,33 +144,49 @@ class TestPhase1SmallScale:
         assert result["pages"][0]["pageNumber"] == 1
         assert result["content"] == "Test content"
     
-    def test_two_page_synthetic_batches(self):
-        """Test basic stitching with two simple synthetic batches."""
-        batch1 = create_simple_batch([1], "First batch content. ")
-        batch2 = create_simple_batch([2], "Second batch content.")
+    @pytest.mark.parametrize(
+        "content1, content2",
+        [
+            ("First batch content. ", "Second batch content."),
+            ("", "Only content"),
+            ("Content 1. ", "Content 2."),
+        ],
+        ids=["two_page_synthetic_batches", "edge_case_empty_content", "edge_case_no_paragraphs"],
+    )
+    def test_two_single_page_batches(self, content1, content2):
+        """Test basic stitching of two single-page batches, including empty content and no paragraphs."""
+        # Batches are built inside the test because stitching extends the first one in place
+        batch1 = create_simple_batch([1], content1)
+        batch2 = create_simple_batch([2], content2)
         
         # Test automatic offset calculation
         result = stitch_analysis_results(batch1, batch2)
         
-        assert len(result["pages"]) == 2
-        assert result["pages"][0]["pageNumber"] == 1
-        assert result["pages"][1]["pageNumber"] == 2
-        assert result["content"] == "First batch content. Second batch content."
+        assert get_page_numbers(result) == [1, 2]
+        assert result["content"] == content1 + content2
+        assert result.get("paragraphs", []) == []
     
-    def test_span_offset_calculation(self):
-        """Test that span offsets are correctly calculated."""
-        batch1 = create_batch_with_paragraph([1], "First content. ", "First content. ")
-        batch2 = create_batch_with_paragraph([2], "Second content.", "Second content.")
-        
-        # Calculate expected values BEFORE stitching (since stitching modifies inputs)
+    @pytest.mark.parametrize(
+        "create_batch, key, get_offset",
+        [
+            (create_batch_with_paragraph, "paragraphs", lambda element: element["spans"][0]["offset"]),
+            (create_batch_with_word, "words", lambda element: element["span"]["offset"]),
+        ],
+        ids=["paragraph_spans", "single_word_span"],
+    )
+    def test_span_offset_calculation(self, create_batch, key, get_offset):
+        """Test that span offsets are correctly calculated, for both "spans" and a single "span"."""
+        batch1 = create_batch([1], "First content. ", "First")
+        batch2 = create_batch([2], "Second content.", "Second")
+        
+        # Calculate expected values BEFORE stitching (since stitching extends the first batch in place)
         batch1_content_len = len(batch1["content"])
         
         result = stitch_analysis_results(batch1, batch2)
         
-        # Check that paragraph spans were updated correctly
-        assert len(result["paragraphs"]) == 2
-        assert result["paragraphs"][0]["spans"][0]["offset"] == 0
-        assert result["paragraphs"][1]["spans"][0]["offset"] == batch1_content_len
+        assert len(result[key]) == 2
+        assert get_offset(result[key][0]) == 0
+        assert get_offset(result[key][1]) == batch1_content_len
     
     def test_multiple_element_types(self):
         """Test stitching with different element types."""
@@ -175,51 +256,32 @@ class TestPhase1SmallScale:
         assert len(result["content"]) == total_expected_len
         
         # Verify page numbering remains correct
-        page_numbers = [page["pageNumber"] for page in result["pages"]]
+        page_numbers = get_page_numbers(result)
         assert page_numbers == list(range(1, expected_pages + 1))
     
-    def test_edge_case_empty_content(self):
-        """Test edge case with empty content in one batch."""
-        batch1 = create_simple_batch([1], "")
-        batch2 = create_simple_batch([2], "Only content")
-        
-        result = stitch_analysis_results(batch1, batch2)
-        
-        assert result["content"] == "Only content"
-        assert len(result["pages"]) == 2
-    
-    def test_edge_case_no_paragraphs(self):
-        """Test edge case when batches have no paragraphs."""
-        batch1 = {"content": "Content 1. ", "pages": [{"pageNumber": 1}]}
-        batch2 = {"content": "Content 2.", "pages": [{"pageNumber": 2}]}
-        
-        result = stitch_analysis_results(batch1, batch2)
-        
-        assert result["content"] == "Content 1. Content 2."
-        assert len(result["pages"]) == 2
-        assert result.get("paragraphs", []) == []
-    
-    def test_single_word_span_handling(self):
-        """Test that individual word spans (using 'span' not 'spans') are handled correctly."""
-        batch1 = {
-            "content": "Word1 ",
-            "pages": [{"pageNumber": 1}],
-            "words": [{"span": {"offset": 0, "length": 5}, "content": "Word1"}]
-        }
+    def test_new_batch_not_modified(self):
+        """Test that stitching leaves the new batch and its elements untouched."""
+        batch1 = create_batch_with_paragraph([1], "First content. ", "First content. ")
         batch2 = {
-            "content": "Word2",
-            "pages": [{"pageNumber": 2}],
-            "words": [{"span": {"offset": 0, "length": 5}, "content": "Word2"}]
+            "content": "Second content.",
+            "pages": [{"pageNumber": 1}],
+            "paragraphs": [{"spans": [{"offset": 0, "length": 15}], "boundingRegions": [{"pageNumber": 1}]}],
+            "words": [{"span": {"offset": 0, "length": 6}, "content": "Second"}]
         }
         
-        # Calculate expected offset
-        batch1_content_len = len(batch1["content"])
-        
         result = stitch_analysis_results(batch1, batch2)
         
-        assert len(result["words"]) == 2
-        assert result["words"][0]["span"]["offset"] == 0
-        assert result["words"][1]["span"]["offset"] == batch1_content_len
+        # The stitched result carries shifted copies...
+        assert result["pages"][1]["pageNumber"] == 2
+        assert result["paragraphs"][1]["spans"][0]["offset"] == 15
+        assert result["paragraphs"][1]["boundingRegions"][0]["pageNumber"] == 2
+        assert result["words"][0]["span"]["offset"] == 15
+        
+        # ...while the new batch keeps its original values
+        assert batch2["pages"][0]["pageNumber"] == 1
+        assert batch2["paragraphs"][0]["spans"][0]["offset"] == 0
+        assert batch2["paragraphs"][0]["boundingRegions"][0]["pageNumber"] == 1
+        assert batch2["words"][0]["span"]["offset"] == 0
 
 
 class TestPhase1RealDataSubsets:
@@ -440,49 +502,73 @@ class TestPhase1EdgeCases:
         # Both pages should have the same page number (edge case but should not crash)
         assert result["pages"][0]["pageNumber"] == 1
         assert result["pages"][1]["pageNumber"] == 1
+    
+    def test_first_batch_explicit_page_offset(self):
+        """Test that an explicit offset on the first batch shifts every element type, on a copy."""
+        batch = {
+            "content": "Word line",
+            "pages": [{"pageNumber": 1}],
+            "paragraphs": [{"spans": [{"offset": 0, "length": 9}], "boundingRegions": [{"pageNumber": 1}]}],
+            "tables": [{"boundingRegions": [{"pageNumber": 1}]}],
+            "words": [{"span": {"offset": 0, "length": 4}, "boundingRegions": [{"pageNumber": 1}]}],
+            "lines": [{"spans": [{"offset": 0, "length": 9}], "boundingRegions": [{"pageNumber": 1}]}],
+            "selectionMarks": [{"span": {"offset": 5, "length": 1}, "boundingRegions": [{"pageNumber": 1}]}],
+        }
+        
+        result = stitch_analysis_results({}, batch, page_offset=10)
+        
+        # A new result is returned, with all six element arrays shifted consistently
+        # (words, lines and selectionMarks included, as for every later batch)
+        assert result is not batch
+        assert get_page_numbers(result) == [11]
+        for key in ("paragraphs", "tables", "words", "lines", "selectionMarks"):
+            assert result[key][0]["boundingRegions"][0]["pageNumber"] == 11, key
+        
+        # Span offsets are unchanged for the first batch, and the batch itself is untouched
+        assert result["selectionMarks"][0]["span"]["offset"] == 5
+        assert get_page_numbers(batch) == [1]
+        for key in ("paragraphs", "tables", "words", "lines", "selectionMarks"):
+            assert batch[key][0]["boundingRegions"][0]["pageNumber"] == 1, key
 
 
-# TODO: Phase 3 - Large-Scale Testing (Future Implementation)
-"""
-Large-scale testing for production readiness with 12,000+ page documents:
-
-- Full 353-page document validation against ground truth
-- Performance benchmarking for memory usage and execution time  
-- Stress testing with synthetic large datasets
-- Memory efficiency optimization
-- Execution time profiling for very large documents
-
-These tests will be implemented when Phase 1 and Phase 2 are complete
-and the application is ready for large-scale production deployment.
-"""
+@pytest.fixture(scope="class")
+def stitched_1_100(real_batch_1_50, real_batch_51_100):
+    """
+    Stitched result of the first two real batches, computed once per test class.
+    
+    Shared by the Phase 2 tests; tests must not modify it (stitch onto
+    clone_for_stitching(stitched_1_100) to extend it).
+    """
+    return stitch_analysis_results(clone_for_stitching(real_batch_1_50), real_batch_51_100)
 
 
+@pytest.mark.medium
 class TestPhase2MediumScale:
     """Phase 2: Medium-scale validation using real fixture files."""
     
     def test_two_consecutive_batches_basic(self, real_batch_1_50, real_batch_51_100):
         """Test basic stitching of two consecutive 50-page batches with automatic offset calculation."""
-        # Calculate expected values BEFORE stitching (since stitching modifies inputs)
+        # Calculate expected values BEFORE stitching (since stitching extends the first batch in place)
         expected_pages = len(real_batch_1_50["pages"]) + len(real_batch_51_100["pages"])
         expected_paragraphs = len(real_batch_1_50["paragraphs"]) + len(real_batch_51_100["paragraphs"])
         batch1_content_len = len(real_batch_1_50["content"])
         total_expected_len = batch1_content_len + len(real_batch_51_100["content"])
         
         # Use automatic page offset calculation
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitch_analysis_results(clone_for_stitching(real_batch_1_50), real_batch_51_100)
         
         assert len(result["pages"]) == expected_pages
         assert len(result["paragraphs"]) == expected_paragraphs
         assert len(result["content"]) == total_expected_len
         
         # Verify page numbering is consecutive
-        page_numbers = [page["pageNumber"] for page in result["pages"]]
-        assert page_numbers == list(range(1, expected_pages + 1))
+        page_numbers = get_page_number_array(result)
+        assert page_numbers == array("i", range(1, expected_pages + 1))
     
-    def test_three_consecutive_batches(self, real_batch_1_50, real_batch_51_100, real_batch_101_150):
+    def test_three_consecutive_batches(self, stitched_1_100, real_batch_101_150):
         """Test cumulative stitching of three consecutive batches with automatic calculation."""
-        # Stitch first two batches with automatic offset
-        intermediate_result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        # Continue from the shared two-batch stitch; clone it, since stitching extends it in place
+        intermediate_result = clone_for_stitching(stitched_1_100)
         
         # Calculate expected values BEFORE final stitching
         expected_pages = len(intermediate_result["pages"]) + len(real_batch_101_150["pages"])
@@ -498,15 +584,13 @@ class TestPhase2MediumScale:
         assert len(final_result["content"]) == total_expected_len
         
         # Verify all page numbers are consecutive 1-150
-        page_numbers = [page["pageNumber"] for page in final_result["pages"]]
-        assert page_numbers == list(range(1, expected_pages + 1))
+        page_numbers = get_page_number_array(final_result)
+        assert page_numbers == array("i", range(1, expected_pages + 1))
     
-    def test_span_offset_accuracy_at_scale(self, real_batch_1_50, real_batch_51_100):
+    def test_span_offset_accuracy_at_scale(self, real_batch_1_50, stitched_1_100):
         """Test span offset calculations at medium scale with automatic offset."""
-        # Calculate expected offset BEFORE stitching
         batch1_content_len = len(real_batch_1_50["content"])
-        
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitched_1_100
         
         # Check that all second batch spans have been offset correctly
         for paragraph in result["paragraphs"]:
@@ -515,15 +599,16 @@ class TestPhase2MediumScale:
                 for span in paragraph.get("spans", []):
                     assert span["offset"] >= batch1_content_len, f"Span offset {span['offset']} should be >= {batch1_content_len}"
     
-    def test_element_preservation_at_scale(self, real_batch_1_50, real_batch_51_100):
+    def test_element_preservation_at_scale(self, real_batch_1_50, real_batch_51_100, stitched_1_100):
         """Test that all element types are preserved at medium scale."""
-        # Count elements BEFORE stitching  
+        # The input fixtures are left untouched by the shared stitch, so they still hold
+        # the per-batch counts
         batch1_paragraphs = len(real_batch_1_50["paragraphs"])
         batch2_paragraphs = len(real_batch_51_100["paragraphs"])
         batch1_pages = len(real_batch_1_50["pages"])
         batch2_pages = len(real_batch_51_100["pages"])
         
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitched_1_100
         
         # Verify all elements are preserved
         assert len(result["paragraphs"]) == batch1_paragraphs + batch2_paragraphs
@@ -537,15 +622,14 @@ class TestPhase2MediumScale:
                 result_count = len(result.get(element_type, []))
                 assert result_count == batch1_count + batch2_count, f"{element_type} count mismatch"
     
-    def test_ground_truth_content_sample_validation(self, real_batch_1_50, real_batch_51_100, ground_truth_result):
+    def test_ground_truth_content_sample_validation(self, stitched_1_100, ground_truth_result):
         """Test that stitched content matches ground truth for sample validation."""
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitched_1_100
         
-        # Compare first 500 characters as a sample
-        result_sample = result["content"][:500]
+        # Compare first 500 characters as a sample (startswith avoids slicing the result)
         ground_truth_sample = ground_truth_result["content"][:500]
         
-        assert result_sample == ground_truth_sample, "Content sample should match ground truth"
+        assert result["content"].startswith(ground_truth_sample), "Content sample should match ground truth"
         
         # Since we're only stitching first 100 pages, we can't compare the end with full ground truth
         # Instead, verify that our result length is reasonable for 100 pages
@@ -554,13 +638,14 @@ class TestPhase2MediumScale:
         assert "CHAPTER" in result["content"], "Content should contain chapter markers"
         assert result["content"].startswith("# DRACULA"), "Content should start with title"
     
-    def test_page_boundaries_across_batches(self, real_batch_1_50, real_batch_51_100):
+    def test_page_boundaries_across_batches(self, stitched_1_100):
         """Test that page boundaries are correctly maintained across batches."""
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitched_1_100
         
-        # Check that page numbers are exactly 1-100 with no gaps
-        page_numbers = sorted([page["pageNumber"] for page in result["pages"]])
-        expected_pages = list(range(1, 101))  # Pages 1-100
+        # Check that page numbers are exactly 1-100, in order, with no gaps. Stitching emits
+        # pages in document order, so no sort is needed before comparing.
+        page_numbers = get_page_number_array(result)
+        expected_pages = array("i", range(1, 101))  # Pages 1-100
         assert page_numbers == expected_pages, f"Page numbers should be 1-100, got {page_numbers[:10]}...{page_numbers[-10:]}"
         
         # Check that elements reference valid page numbers
@@ -569,9 +654,37 @@ class TestPhase2MediumScale:
                 page_num = region["pageNumber"]
                 assert 1 <= page_num <= 100, f"Invalid page number {page_num} in paragraph"
     
-    def test_data_structure_consistency(self, real_batch_1_50, real_batch_51_100):
+    def test_stitch_many_matches_pairwise_stitching(self, real_batch_1_50, real_batch_51_100, real_batch_101_150):
+        """Test that one-pass stitching of three batches matches cumulative pairwise stitching."""
+        batches = [real_batch_1_50, real_batch_51_100, real_batch_101_150]
+        
+        # Stitch in one pass first; it leaves its inputs untouched
+        many_result = stitch_analysis_results_many(batches)
+        
+        pairwise_result = stitch_analysis_results({}, real_batch_1_50)
+        for batch in batches[1:]:
+            pairwise_result = stitch_analysis_results(pairwise_result, batch)
+        
+        assert many_result["content"] == pairwise_result["content"]
+        assert many_result["pages"] == pairwise_result["pages"]
+        assert many_result["paragraphs"] == pairwise_result["paragraphs"]
+        assert get_page_number_array(many_result) == array("i", range(1, 151))
+    
+    def test_stitching_leaves_session_fixtures_intact(self, real_batch_1_50, real_batch_51_100):
+        """Test that stitching a cloned first batch does not modify the shared fixtures."""
+        batch1_pages = len(real_batch_1_50["pages"])
+        batch1_content = real_batch_1_50["content"]
+        batch2_first_offset = real_batch_51_100["paragraphs"][0]["spans"][0]["offset"]
+        
+        stitch_analysis_results(clone_for_stitching(real_batch_1_50), real_batch_51_100)
+        
+        assert len(real_batch_1_50["pages"]) == batch1_pages
+        assert real_batch_1_50["content"] is batch1_content
+        assert real_batch_51_100["paragraphs"][0]["spans"][0]["offset"] == batch2_first_offset
+    
+    def test_data_structure_consistency(self, stitched_1_100):
         """Test that the stitched result maintains Azure DI data structure consistency."""
-        result = stitch_analysis_results(real_batch_1_50, real_batch_51_100)
+        result = stitched_1_100
         
         # Check that required top-level fields exist
         assert "content" in result
@@ -597,6 +710,53 @@ class TestPhase2MediumScale:
                 assert span["offset"] >= 0
 
 
+# Phase 3 - Large-Scale Testing
+"""
+Large-scale testing toward 12,000+ page documents. TestPhase3LargeScale stitches a
+synthetic 12,000-page document; full 353-page validation against ground truth and
+performance benchmarking are covered by Phase 4 below.
+
+Still TODO:
+- Memory efficiency optimization
+- Execution time profiling for very large documents
+"""
+
+
+class TestPhase3LargeScale:
+    """Phase 3: Large-scale stress testing with synthetic batches."""
+    
+    def test_synthetic_12000_page_stitching(self):
+        """Test stitching eight synthetic 1500-page batches into a 12,000-page document."""
+        paragraph_text = "Synthetic paragraph. "
+        batches = [create_synthetic_batch(first_page, 1500, paragraph_text) for first_page in range(1, 12001, 1500)]
+        
+        result = stitch_analysis_results_many(batches)
+        
+        assert get_page_number_array(result) == array("i", range(1, 12001))
+        assert len(result["content"]) == 12000 * len(paragraph_text)
+        
+        # Every paragraph sits on its own page at a fixed stride through the content
+        text_len = len(paragraph_text)
+        assert len(result["paragraphs"]) == 12000
+        for i, paragraph in enumerate(result["paragraphs"]):
+            assert paragraph["spans"][0]["offset"] == i * text_len
+            assert paragraph["boundingRegions"][0]["pageNumber"] == i + 1
+
+
+# Function-scoped on purpose: stitching extends the first batch in place, so a shared
+# (module-scoped) batch would leak pages from one test into the next.
+@pytest.fixture
+def simple_batch_1():
+    """First single-page synthetic batch."""
+    return create_simple_batch([1], "First content. ")
+
+
+@pytest.fixture
+def simple_batch_2():
+    """Second single-page synthetic batch, consecutive with simple_batch_1."""
+    return create_simple_batch([2], "Second content.")
+
+
 class TestValidationFunctions:
     """Test the new validation and utility functions added to the application logic."""
     
@@ -610,93 +770,53 @@ class TestValidationFunctions:
         # Should not raise any exception
         validate_batch_structure(valid_batch)
     
-    def test_validate_batch_structure_missing_content(self):
-        """Test validation fails when content field is missing."""
-        invalid_batch = {
-            "pages": [{"pageNumber": 1}]
-        }
-        
-        with pytest.raises(ValueError, match="Missing required field: content"):
-            validate_batch_structure(invalid_batch)
-    
-    def test_validate_batch_structure_missing_pages(self):
-        """Test validation fails when pages field is missing."""
-        invalid_batch = {
-            "content": "Test content"
-        }
-        
-        with pytest.raises(ValueError, match="Missing required field: pages"):
-            validate_batch_structure(invalid_batch)
-    
-    def test_validate_batch_structure_invalid_content_type(self):
-        """Test validation fails when content is not a string."""
-        invalid_batch = {
-            "content": 123,
-            "pages": [{"pageNumber": 1}]
-        }
-        
-        with pytest.raises(ValueError, match="Content field must be a string"):
-            validate_batch_structure(invalid_batch)
-    
-    def test_validate_batch_structure_invalid_pages_type(self):
-        """Test validation fails when pages is not a list."""
-        invalid_batch = {
-            "content": "Test content",
-            "pages": "not a list"
-        }
-        
-        with pytest.raises(ValueError, match="Pages field must be a list"):
-            validate_batch_structure(invalid_batch)
-    
-    def test_validate_batch_structure_invalid_page_structure(self):
-        """Test validation fails when page lacks pageNumber."""
-        invalid_batch = {
-            "content": "Test content",
-            "pages": [{"notPageNumber": 1}]
-        }
-        
-        with pytest.raises(ValueError, match="Page 0 missing pageNumber field"):
+    @pytest.mark.parametrize(
+        "invalid_batch, error_pattern",
+        [
+            ({"pages": [{"pageNumber": 1}]}, "Missing required field: content"),
+            ({"content": "Test content"}, "Missing required field: pages"),
+            ({"content": 123, "pages": [{"pageNumber": 1}]}, "Content field must be a string"),
+            ({"content": "Test content", "pages": "not a list"}, "Pages field must be a list"),
+            ({"content": "Test content", "pages": [{"notPageNumber": 1}]}, "Page 0 missing pageNumber field"),
+        ],
+        ids=["missing_content", "missing_pages", "invalid_content_type", "invalid_pages_type", "invalid_page_structure"],
+    )
+    def test_validate_batch_structure_invalid(self, invalid_batch, error_pattern):
+        """Test that validation fails with a descriptive error for each kind of malformed batch."""
+        with pytest.raises(ValueError, match=error_pattern):
             validate_batch_structure(invalid_batch)
     
-    def test_calculate_page_offset_empty_first_batch(self):
-        """Test page offset calculation when first batch is empty."""
-        empty_batch = {}
-        new_batch = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}
-        
-        offset = calculate_page_offset(empty_batch, new_batch)
-        assert offset == 0
-    
-    def test_calculate_page_offset_consecutive_batches(self):
-        """Test page offset calculation for consecutive batches."""
-        first_batch = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}
-        second_batch = {"pages": [{"pageNumber": 3}, {"pageNumber": 4}]}
-        
-        offset = calculate_page_offset(first_batch, second_batch)
-        assert offset == 0  # Already consecutive, no offset needed
+    @pytest.mark.parametrize(
+        "first_batch, new_batch, expected_offset",
+        [
+            ({}, {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}, 0),
+            # Already consecutive, no offset needed
+            ({"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}, {"pages": [{"pageNumber": 3}, {"pageNumber": 4}]}, 0),
+            # Should offset by 2 to make second batch pages 3,4
+            ({"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}, {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}, 2),
+        ],
+        ids=["empty_first_batch", "consecutive_batches", "non_consecutive_batches"],
+    )
+    def test_calculate_page_offset(self, first_batch, new_batch, expected_offset):
+        """Test page offset calculation for empty, consecutive and restarted page numbering."""
+        assert calculate_page_offset(first_batch, new_batch) == expected_offset
     
-    def test_calculate_page_offset_non_consecutive_batches(self):
-        """Test page offset calculation for non-consecutive batches."""
-        first_batch = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}
-        second_batch = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}  # Needs offset
-        
-        offset = calculate_page_offset(first_batch, second_batch)
-        assert offset == 2  # Should offset by 2 to make second batch pages 3,4
-    
-    def test_validate_batch_sequence_consecutive(self):
-        """Test validation passes for consecutive batches."""
-        batch1 = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}
-        batch2 = {"pages": [{"pageNumber": 3}, {"pageNumber": 4}]}
-        batch3 = {"pages": [{"pageNumber": 5}, {"pageNumber": 6}]}
-        
-        # Should not raise any exception
-        validate_batch_sequence([batch1, batch2, batch3])
-    
-    def test_validate_batch_sequence_single_batch(self):
-        """Test validation with single batch (should pass)."""
-        batch1 = {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}
-        
+    @pytest.mark.parametrize(
+        "batches",
+        [
+            [
+                {"pages": [{"pageNumber": 1}, {"pageNumber": 2}]},
+                {"pages": [{"pageNumber": 3}, {"pageNumber": 4}]},
+                {"pages": [{"pageNumber": 5}, {"pageNumber": 6}]},
+            ],
+            [{"pages": [{"pageNumber": 1}, {"pageNumber": 2}]}],
+        ],
+        ids=["consecutive", "single_batch"],
+    )
+    def test_validate_batch_sequence_valid(self, batches):
+        """Test validation passes for consecutive batches and for a single batch."""
         # Should not raise any exception
-        validate_batch_sequence([batch1])
+        validate_batch_sequence(batches)
     
     def test_validate_batch_sequence_non_consecutive(self):
         """Test validation fails for non-consecutive batches."""
@@ -706,33 +826,70 @@ class TestValidationFunctions:
         with pytest.raises(ValueError, match="Non-consecutive batches: gap between page 2 and 4"):
             validate_batch_sequence([batch1, batch2])
     
-    def test_stitch_analysis_results_with_validation_enabled(self):
-        """Test stitching with input validation enabled (default)."""
-        batch1 = create_simple_batch([1], "First content. ")
-        batch2 = create_simple_batch([2], "Second content.")
-        
-        # Should work with validation enabled (default)
-        result = stitch_analysis_results(batch1, batch2, validate_inputs=True)
+    @pytest.mark.parametrize("validate_inputs", [True, False], ids=["validation_enabled", "validation_disabled"])
+    def test_stitch_analysis_results_validation_flag(self, simple_batch_1, simple_batch_2, validate_inputs):
+        """Test that valid batches stitch the same way with input validation enabled or disabled."""
+        result = stitch_analysis_results(simple_batch_1, simple_batch_2, validate_inputs=validate_inputs)
         assert len(result["pages"]) == 2
         assert result["content"] == "First content. Second content."
     
-    def test_stitch_analysis_results_with_validation_disabled(self):
-        """Test stitching with input validation disabled."""
-        batch1 = create_simple_batch([1], "First content. ")
-        batch2 = create_simple_batch([2], "Second content.")
-        
-        # Should work with validation disabled
-        result = stitch_analysis_results(batch1, batch2, validate_inputs=False)
-        assert len(result["pages"]) == 2
-        assert result["content"] == "First content. Second content."
-    
-    def test_stitch_analysis_results_validation_catches_invalid_input(self):
+    def test_stitch_analysis_results_validation_catches_invalid_input(self, simple_batch_1):
         """Test that validation catches invalid input when enabled."""
-        valid_batch = create_simple_batch([1], "Valid content. ")
         invalid_batch = {"invalid": "structure"}  # Missing required fields
         
         with pytest.raises(ValueError, match="Missing required field"):
-            stitch_analysis_results(valid_batch, invalid_batch, validate_inputs=True)
+            stitch_analysis_results(simple_batch_1, invalid_batch, validate_inputs=True)
+    
+    def test_stitch_analysis_results_many(self):
+        """Test one-pass stitching of several batches, including page offset correction."""
+        batch1 = create_batch_with_paragraph([1], "First. ", "First. ")
+        batch2 = create_batch_with_paragraph([1], "Second. ", "Second. ")  # Will become page 2
+        batch3 = create_batch_with_paragraph([3], "Third.", "Third.")
+        
+        result = stitch_analysis_results_many([batch1, batch2, batch3])
+        
+        assert result["content"] == "First. Second. Third."
+        assert get_page_numbers(result) == [1, 2, 3]
+        assert [p["spans"][0]["offset"] for p in result["paragraphs"]] == [0, 7, 15]
+        
+        # Empty input produces an empty result
+        assert stitch_analysis_results_many([]) == {}
+    
+    def test_stitcher_incremental(self):
+        """Test adding batches to a Stitcher one at a time, finalizing in between."""
+        batch1 = create_batch_with_paragraph([1], "First. ", "First. ")
+        batch2 = create_batch_with_paragraph([1], "Second. ", "Second. ")  # Will become page 2
+        batch3 = create_batch_with_paragraph([1, 2], "Third.", "Third.")  # Will become pages 3-4
+        
+        stitcher = Stitcher().add_batch(batch1).add_batch(batch2)
+        assert stitcher.page_count == 2
+        assert stitcher.finalize()["content"] == "First. Second. "
+        
+        result = stitcher.add_batch(batch3).finalize()
+        assert result["content"] == "First. Second. Third."
+        assert get_page_numbers(result) == [1, 2, 3, 4]
+        assert [p["spans"][0]["offset"] for p in result["paragraphs"]] == [0, 7, 15]
+        
+        # The added batches keep their original values
+        assert get_page_numbers(batch2) == [1]
+        assert batch3["paragraphs"][0]["spans"][0]["offset"] == 0
+        
+        # Nothing added produces an empty result
+        assert Stitcher().finalize() == {}
+    
+    def test_unvalidated_batches_without_pages_or_content(self):
+        """Test that, without validation, batches lacking pages or content still stitch."""
+        paragraphs_only = {"paragraphs": [{"spans": [{"offset": 0, "length": 5}]}]}
+        
+        result = stitch_analysis_results({}, paragraphs_only, validate_inputs=False)
+        assert result["paragraphs"] == paragraphs_only["paragraphs"]
+        
+        result = stitch_analysis_results(
+            create_simple_batch([1], "First. "), paragraphs_only, validate_inputs=False
+        )
+        assert get_page_numbers(result) == [1]
+        assert result["content"] == "First. "
+        assert result["paragraphs"][0]["spans"][0]["offset"] == 7
     
     def test_automatic_page_offset_calculation(self):
         """Test that automatic page offset calculation works correctly."""
@@ -743,86 +900,33 @@ class TestValidationFunctions:
         result = stitch_analysis_results(batch1, batch2)
         
         # Pages should be numbered 1, 2, 3, 4
-        page_numbers = [page["pageNumber"] for page in result["pages"]]
-        assert page_numbers == [1, 2, 3, 4]
-
-
-# Fixtures for loading real data
-@pytest.fixture
-def real_batch_1_50():
-    """Load the real batch_1-50.json fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "dracula", "batch_1-50.json")
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
+        page_numbers = get_page_number_array(result)
+        assert page_numbers == array("i", range(1, 5))
 
 
-@pytest.fixture
-def real_batch_51_100():
-    """Load the real batch_51-100.json fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "dracula", "batch_51-100.json")
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
+# Phase 4 - Full Document Testing. The all_batch_fixtures and ground_truth_full fixtures are
+# session-scoped (see conftest.py); stitch into clone_for_stitching(...) copies of them.
 
-
-@pytest.fixture
-def real_batch_101_150():
-    """Load the real batch_101-150.json fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "dracula", "batch_101-150.json")
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
-
-
-@pytest.fixture
-def ground_truth_result():
-    """Load the ground truth result fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "dracula", "ground_truth_result.json")
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
-
-
-# Phase 4 Fixtures - Full Document Testing
-@pytest.fixture
-def all_batch_fixtures():
-    """Load all 8 batch files in the correct order for full document reconstruction."""
-    fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures", "dracula")
-    batch_files = [
-        "batch_1-50.json",
-        "batch_51-100.json", 
-        "batch_101-150.json",
-        "batch_151-200.json",
-        "batch_201-250.json",
-        "batch_251-300.json",
-        "batch_301-350.json",
-        "batch_351-353.json"
-    ]
-    
-    batches = []
-    for batch_file in batch_files:
-        batch_path = os.path.join(fixtures_dir, batch_file)
-        with open(batch_path, 'r') as f:
-            batches.append(json.load(f))
-    
-    return batches
-
-
-@pytest.fixture
-def ground_truth_full():
-    """Load the ground truth result fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "dracula", "ground_truth_result.json")
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
+# SHA-256 of the full stitched 353-page content. The stitched content differs slightly
+# from ground_truth_result.json (see the length tolerances below), so this pins the exact
+# stitched output instead. Regenerate it if the batch fixtures are regenerated.
+STITCHED_FULL_CONTENT_SHA256 = "2c6aae32148ae7efcc2e80680329a6e877cb8c4fe8746328b1be272a5920cfd3"
 
 
 def create_stitched_full_document(all_batch_fixtures):
     """Create the full stitched document (helper function for individual tests)."""
-    # Start with first batch
-    result = all_batch_fixtures[0].copy()
-    
-    # Stitch all remaining batches sequentially
-    for i, batch in enumerate(all_batch_fixtures[1:], 1):
-        result = stitch_analysis_results(result, batch.copy())
+    # Validates each batch once, never modifies the fixtures and joins the content once
+    return stitch_analysis_results_many(all_batch_fixtures)
+
+
+@pytest.fixture(scope="class")
+def stitched_full(all_batch_fixtures):
+    """
+    The full 353-page stitched document, computed once per test class.
     
-    return result
+    Shared by the Phase 4 tests that only inspect the result; tests must not modify it.
+    """
+    return create_stitched_full_document(all_batch_fixtures)
 
 
 class TestPhase4FullDocumentStitching:
@@ -834,28 +938,26 @@ class TestPhase4FullDocumentStitching:
         import time
         start_time = time.time()
         
-        # Start with the first batch
-        result = all_batch_fixtures[0].copy()
-        initial_pages = len(result["pages"])
-        initial_paragraphs = len(result["paragraphs"])
+        # Start with the first batch; the stitcher leaves the fixtures unmodified
+        stitcher = Stitcher().add_batch(all_batch_fixtures[0])
+        expected_total_pages = stitcher.page_count
         
         # Stitch all remaining batches sequentially using automatic offset calculation
         for i, batch in enumerate(all_batch_fixtures[1:], 1):
-            batch_copy = batch.copy()  # Don't modify original fixtures
-            
             # Track batch info before stitching
-            batch_pages = len(batch_copy["pages"])
-            batch_paragraphs = len(batch_copy["paragraphs"])
+            batch_pages = len(batch["pages"])
+            batch_paragraphs = len(batch["paragraphs"])
             
             # Perform stitching with automatic offset calculation
-            result = stitch_analysis_results(result, batch_copy)
+            stitcher.add_batch(batch)
             
             # Verify incremental progress
-            expected_total_pages = initial_pages + sum(len(b["pages"]) for b in all_batch_fixtures[1:i+1])
-            assert len(result["pages"]) == expected_total_pages, f"Page count mismatch after batch {i+1}"
+            expected_total_pages += batch_pages
+            assert stitcher.page_count == expected_total_pages, f"Page count mismatch after batch {i+1}"
             
             print(f"Batch {i+1} stitched: +{batch_pages} pages, +{batch_paragraphs} paragraphs")
         
+        result = stitcher.finalize()
         end_time = time.time()
         execution_time = end_time - start_time
         
@@ -865,8 +967,8 @@ class TestPhase4FullDocumentStitching:
         assert result["pages"][-1]["pageNumber"] == 353, "Last page should be numbered 353"
         
         # Verify page numbering is consecutive
-        page_numbers = [page["pageNumber"] for page in result["pages"]]
-        expected_pages = list(range(1, 354))  # 1 through 353
+        page_numbers = get_page_number_array(result)
+        expected_pages = array("i", range(1, 354))  # 1 through 353
         assert page_numbers == expected_pages, "Page numbers should be consecutive from 1 to 353"
         
         # Verify content is substantial
@@ -878,9 +980,9 @@ class TestPhase4FullDocumentStitching:
         
         print(f"✅ Full document stitching successful: 353 pages in {execution_time:.2f} seconds")
 
-    def test_full_document_structure_integrity(self, all_batch_fixtures, ground_truth_full):
+    def test_full_document_structure_integrity(self, stitched_full, ground_truth_full):
         """Validate that the stitched result maintains all structural elements correctly."""
-        result = create_stitched_full_document(all_batch_fixtures)
+        result = stitched_full
         ground_truth = ground_truth_full
         
         # Critical structural validation
@@ -917,9 +1019,9 @@ class TestPhase4FullDocumentStitching:
         
         print(f"✅ Structure integrity validated: {len(result['pages'])} pages, {len(result['paragraphs'])} paragraphs")
 
-    def test_full_document_content_samples(self, all_batch_fixtures, ground_truth_full):
+    def test_full_document_content_samples(self, stitched_full, ground_truth_full):
         """Validate content accuracy using strategic sampling across the document."""
-        result = create_stitched_full_document(all_batch_fixtures)
+        result = stitched_full
         ground_truth = ground_truth_full
         
         # Beginning content validation (first 500 characters)
@@ -932,6 +1034,11 @@ class TestPhase4FullDocumentStitching:
         gt_end = ground_truth["content"][-500:]
         assert result_end == gt_end, "Last 500 characters should match exactly"
         
+        # Validate the full content in one pass; a digest keeps failure output short
+        # instead of diffing two multi-MB strings
+        content_digest = hashlib.sha256(result["content"].encode("utf-8")).hexdigest()
+        assert content_digest == STITCHED_FULL_CONTENT_SHA256, "Full stitched content changed"
+        
         # Validate key content markers and structure
         chapter_count_result = result["content"].count("CHAPTER")
         chapter_count_gt = ground_truth["content"].count("CHAPTER")
@@ -953,109 +1060,107 @@ class TestPhase4FullDocumentStitching:
         assert "Jonathan Harker" in result["content"], "Should contain character names"
         assert "Van Helsing" in result["content"], "Should contain character names"
         assert "Mina" in result["content"], "Should contain character names"
-        assert "Castle Dracula" in result["content"] or "castle" in result["content"].lower(), "Should contain castle references"
+        assert "Castle Dracula" in result["content"] or re.search("castle", result["content"], re.IGNORECASE), \
+            "Should contain castle references"
         
         print(f"✅ Content samples validated: start/end exact match, {chapter_count_result} chapters, length within tolerance")
 
-    def test_full_document_span_offset_precision(self, all_batch_fixtures):
+    def test_full_document_span_offset_precision(self, stitched_full):
         """Verify span offset calculations are accurate across all 353 pages."""
-        result = create_stitched_full_document(all_batch_fixtures)
+        result = stitched_full
         
-        # Collect all spans with their page numbers
-        span_info = []
+        # Collect the spans as parallel typed columns (page, offset, end) in document order,
+        # rather than one dict per span
+        span_pages = array("q")
+        span_offsets = array("q")
+        span_ends = array("q")
         for paragraph in result["paragraphs"]:
+            spans = paragraph.get("spans", [])
             for region in paragraph.get("boundingRegions", []):
                 page_num = region["pageNumber"]
-                for span in paragraph.get("spans", []):
-                    span_info.append({
-                        "page": page_num,
-                        "offset": span["offset"],
-                        "length": span["length"]
-                    })
-        
-        # Verify spans are monotonically increasing
-        prev_offset = -1
-        for i, span in enumerate(span_info):
-            assert span["offset"] >= prev_offset, \
-                f"Span {i} has offset {span['offset']} < previous {prev_offset}"
-            prev_offset = span["offset"]
+                for span in spans:
+                    span_pages.append(page_num)
+                    span_offsets.append(span["offset"])
+                    span_ends.append(span["offset"] + span["length"])
+        
+        # Verify spans are monotonically increasing; the pairwise comparison runs in C, and
+        # the failure message (which finds the first decrease) is only built on failure
+        assert all(map(le, span_offsets, islice(span_offsets, 1, None))), \
+            describe_first_offset_decrease(span_offsets)
         
         # Verify spans don't exceed content length
         content_length = len(result["content"])
-        for span in span_info:
-            span_end = span["offset"] + span["length"]
-            assert span_end <= content_length, \
-                f"Span extends beyond content: offset {span['offset']} + length {span['length']} > {content_length}"
+        last_span_end = max(span_ends, default=0)
+        assert last_span_end <= content_length, \
+            f"Span extends beyond content: ends at {last_span_end} > {content_length}"
         
         # Verify spans at critical page boundaries (pages 50, 100, 150, 200, 250, 300)
         boundary_pages = [50, 100, 150, 200, 250, 300]
-        boundary_spans = {page: [] for page in boundary_pages}
+        boundary_offsets = {page: [] for page in boundary_pages}
         
-        for span in span_info:
-            if span["page"] in boundary_pages:
-                boundary_spans[span["page"]].append(span)
+        for page_num, offset in zip(span_pages, span_offsets):
+            if page_num in boundary_offsets:
+                boundary_offsets[page_num].append(offset)
         
         # Verify each boundary has spans and they're reasonable
         for page in boundary_pages:
-            spans = boundary_spans[page]
-            assert len(spans) > 0, f"Page {page} should have at least one span"
+            offsets = boundary_offsets[page]
+            assert len(offsets) > 0, f"Page {page} should have at least one span"
             
             # Verify spans for this page don't have negative offsets
-            for span in spans:
-                assert span["offset"] >= 0, f"Page {page} has negative span offset: {span['offset']}"
+            assert min(offsets) >= 0, f"Page {page} has negative span offset: {min(offsets)}"
         
         # Cross-boundary validation - spans should increase across page boundaries
-        for i in range(len(boundary_pages) - 1):
-            current_page = boundary_pages[i]
-            next_page = boundary_pages[i + 1]
-            
-            current_max_offset = max(s["offset"] for s in boundary_spans[current_page])
-            next_min_offset = min(s["offset"] for s in boundary_spans[next_page])
+        for current_page, next_page in zip(boundary_pages, boundary_pages[1:]):
+            current_max_offset = max(boundary_offsets[current_page])
+            next_min_offset = min(boundary_offsets[next_page])
             
             assert next_min_offset >= current_max_offset, \
                 f"Span offsets don't increase across pages {current_page}->{next_page}: {current_max_offset} -> {next_min_offset}"
         
-        print(f"✅ Span precision validated: {len(span_info)} spans across 353 pages, all monotonic")
+        print(f"✅ Span precision validated: {len(span_offsets)} spans across 353 pages, all monotonic")
 
     def test_full_document_performance_metrics(self, all_batch_fixtures):
         """Benchmark performance and memory usage for production readiness."""
-        import os
         import time
-
-        import psutil
-        
-        # Get initial memory usage
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Track timing for each batch
-        batch_times = []
-        start_time = time.time()
-        
-        # Perform stitching with timing
-        result = all_batch_fixtures[0].copy()
-        
-        for i, batch in enumerate(all_batch_fixtures[1:], 1):
-            batch_start = time.time()
-            batch_copy = batch.copy()
-            result = stitch_analysis_results(result, batch_copy)
-            batch_end = time.time()
+        import tracemalloc
+        
+        def traced_peak_mb():
+            return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        
+        # Trace only the allocations made by stitching; the session fixtures are already
+        # loaded, so their memory doesn't count towards the limits below. Tracing slows
+        # allocation down, which the generous time limits allow for.
+        tracemalloc.start()
+        try:
+            # Track timing for each batch
+            batch_times = []
+            start_time = time.time()
             
-            batch_time = batch_end - batch_start
-            batch_times.append(batch_time)
+            # Perform stitching with timing
+            stitcher = Stitcher().add_batch(all_batch_fixtures[0])
             
-            # Check memory usage
-            current_memory = process.memory_info().rss / 1024 / 1024  # MB
-            memory_increase = current_memory - initial_memory
+            for i, batch in enumerate(all_batch_fixtures[1:], 1):
+                batch_start = time.time()
+                stitcher.add_batch(batch)
+                batch_end = time.time()
+                
+                batch_time = batch_end - batch_start
+                batch_times.append(batch_time)
+                
+                print(f"Batch {i+1}: {batch_time:.2f}s")
             
-            print(f"Batch {i+1}: {batch_time:.2f}s, Memory: {current_memory:.1f}MB (+{memory_increase:.1f}MB)")
+            # tracemalloc records the highest traced total, so this covers every batch
+            memory_increase = traced_peak_mb()
             
-            # Memory shouldn't grow excessively (allow up to 500MB increase)
-            assert memory_increase < 500, f"Memory usage grew too much: {memory_increase:.1f}MB"
+            result = stitcher.finalize()
+            total_time = time.time() - start_time
+            total_memory_increase = traced_peak_mb()
+        finally:
+            tracemalloc.stop()
         
-        total_time = time.time() - start_time
-        final_memory = process.memory_info().rss / 1024 / 1024
-        total_memory_increase = final_memory - initial_memory
+        # Memory shouldn't grow excessively while adding batches (allow up to 500MB increase)
+        assert memory_increase < 500, f"Memory usage grew too much: {memory_increase:.1f}MB"
         
         # Performance assertions
         assert total_time < 30, f"Total stitching time {total_time:.2f}s exceeds 30s limit"
@@ -1076,20 +1181,15 @@ class TestPhase4FullDocumentStitching:
         # and that all batches pass validation
         
         # Start with first batch
-        result = all_batch_fixtures[0].copy()
+        result = clone_for_stitching(all_batch_fixtures[0])
         
         # Validate first batch structure
         validate_batch_structure(result)
         
-        # Stitch remaining batches with validation enabled
+        # Stitch remaining batches with validation enabled; this validates each new batch
+        # (and the stitched result so far) before stitching it in
         for i, batch in enumerate(all_batch_fixtures[1:], 1):
-            batch_copy = batch.copy()
-            
-            # Validate batch structure before stitching
-            validate_batch_structure(batch_copy)
-            
-            # Stitch with validation enabled (default)
-            result = stitch_analysis_results(result, batch_copy, validate_inputs=True)
+            result = stitch_analysis_results(result, batch, validate_inputs=True)
             
             # Verify result still has valid structure
             assert "content" in result
@@ -1102,7 +1202,7 @@ class TestPhase4FullDocumentStitching:
         
         # Verify final result
         assert len(result["pages"]) == 353
-        page_numbers = [page["pageNumber"] for page in result["pages"]]
-        assert page_numbers == list(range(1, 354))
+        page_numbers = get_page_number_array(result)
+        assert page_numbers == array("i", range(1, 354))
         
         print(f"✅ Validation enabled test passed: all {len(all_batch_fixtures)} batches validated and stitched")
@@ -0,0 +1,71 @@
+"""
+Tests for environment loading in utils.py.
+"""
+
+import logging
+import os
+
+import pytest
+
+from utils import ensure_env_loaded
+
+
+@pytest.fixture
+def fresh_env_loader(monkeypatch):
+    """Clear the load-once cache around a test, and undo any variables it loads."""
+    monkeypatch.delenv("UTILS_TEST_SETTING", raising=False)
+    ensure_env_loaded.cache_clear()
+    yield
+    ensure_env_loaded.cache_clear()
+    os.environ.pop("UTILS_TEST_SETTING", None)
+
+
+def test_dotenv_path_loads_named_file(tmp_path, monkeypatch, fresh_env_loader):
+    """DOTENV_PATH loads exactly that file."""
+    env_file = tmp_path / "custom.env"
+    env_file.write_text("UTILS_TEST_SETTING=from-file\n")
+    monkeypatch.setenv("DOTENV_PATH", str(env_file))
+    
+    ensure_env_loaded()
+    
+    assert os.environ["UTILS_TEST_SETTING"] == "from-file"
+
+
+def test_env_is_loaded_once(tmp_path, monkeypatch, fresh_env_loader):
+    """Later calls don't reload the file, even if it changed."""
+    env_file = tmp_path / "custom.env"
+    env_file.write_text("UTILS_TEST_SETTING=first\n")
+    monkeypatch.setenv("DOTENV_PATH", str(env_file))
+    
+    ensure_env_loaded()
+    os.environ.pop("UTILS_TEST_SETTING")
+    env_file.write_text("UTILS_TEST_SETTING=second\n")
+    ensure_env_loaded()
+    
+    assert "UTILS_TEST_SETTING" not in os.environ
+
+
+def test_existing_variables_are_not_overridden(tmp_path, monkeypatch, fresh_env_loader):
+    """Variables already in the environment win over the env file."""
+    env_file = tmp_path / "custom.env"
+    env_file.write_text("UTILS_TEST_SETTING=from-file\n")
+    monkeypatch.setenv("DOTENV_PATH", str(env_file))
+    monkeypatch.setenv("UTILS_TEST_SETTING", "from-environment")
+    
+    ensure_env_loaded()
+    
+    assert os.environ["UTILS_TEST_SETTING"] == "from-environment"
+
+
+@pytest.mark.parametrize("file_text", [None, ""], ids=["missing_file", "empty_file"])
+def test_dotenv_path_loading_nothing_logs_warning(tmp_path, monkeypatch, caplog, fresh_env_loader, file_text):
+    """A DOTENV_PATH that loads no variables (missing or empty file) is reported, not ignored."""
+    env_file = tmp_path / "custom.env"
+    if file_text is not None:
+        env_file.write_text(file_text)
+    monkeypatch.setenv("DOTENV_PATH", str(env_file))
+    
+    with caplog.at_level(logging.WARNING, logger="utils"):
+        ensure_env_loaded()
+    
+    assert f"loaded no variables from {env_file}" in caplog.text
@@ -1,9 +1,18 @@
+import logging
+import os
+from functools import cache
+
 from dotenv import load_dotenv
 
-env_loaded = False
+logger = logging.getLogger(__name__)
+
 
+@cache
 def ensure_env_loaded():
-    global env_loaded
-    if not env_loaded:
-        load_dotenv()
-        env_loaded = True
+    # DOTENV_PATH names the env file directly, skipping python-dotenv's directory search
+    dotenv_path = os.environ.get("DOTENV_PATH")
+    if dotenv_path:
+        if not load_dotenv(dotenv_path, override=False):
+            logger.warning(f"DOTENV_PATH: loaded no variables from {dotenv_path}")
+    else:
+        load_dotenv(override=False)